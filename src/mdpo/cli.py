@@ -14,29 +14,165 @@ OPEN_QUOTE_CHAR = '”' if SPHINX_IS_RUNNING else '"'
 CLOSE_QUOTE_CHAR = '”' if SPHINX_IS_RUNNING else '"'
 
 
-def cli_codespan(value, cli=True):
-    """Command line codespan wrapper.
+def _cli_codespan_sphinx(value, cli=True):  # noqa: ARG001
+    """Sphinx specialization of :py:func:`mdpo.cli.cli_codespan`."""
+    return f'``{value}``'
 
-    This is a compatibility function to make CLI codespans looks good in
-    sphinx-argparse-cli documentation and using ``--help`` option in CLI
-    itself. sphinx-argparse-cli expects the usage of double backticks for
-    codespans, but that format is ugly in CLI.
 
-    Args:
-        value (str): Value to wrap.
-        cli (bool): Wrap when used from command line.
-    """
-    if SPHINX_IS_RUNNING:
-        return f'``{value}``'
+def _cli_codespan_cli(value, cli=True):
+    """Command line specialization of :py:func:`mdpo.cli.cli_codespan`."""
     if cli:  # pragma: no cover
         return f"'{value}'"
     return value
 
 
+# Command line codespan wrapper.
+#
+# This is a compatibility function to make CLI codespans looks good in
+# sphinx-argparse-cli documentation and using ``--help`` option in CLI
+# itself. sphinx-argparse-cli expects the usage of double backticks for
+# codespans, but that format is ugly in CLI.
+#
+# Since ``SPHINX_IS_RUNNING`` is fixed at import, the proper specialization
+# is bound here once, avoiding the branch on every call.
+cli_codespan = _cli_codespan_sphinx if SPHINX_IS_RUNNING else _cli_codespan_cli
+
+
+_MDPO_ON_MDPO_ENABLE = cli_codespan(
+    f'--command-alias {OPEN_QUOTE_CHAR}mdpo-on:mdpo-enable'
+    f'{CLOSE_QUOTE_CHAR}',
+)
+_MDPO_ON_ENABLE = cli_codespan(
+    f'--command-alias {OPEN_QUOTE_CHAR}mdpo-on:enable'
+    f'{CLOSE_QUOTE_CHAR}',
+)
+_COMMAND_ALIAS_HELP_EXAMPLE = (
+    ' For example, if you want to use "<!-- mdpo-on -->" instead of'
+    f' "<!-- mdpo-enable -->", you can pass either {_MDPO_ON_MDPO_ENABLE}'
+    f' or {_MDPO_ON_ENABLE} arguments.'
+)
+_MARKUP_ENCODING_HELP = {
+    'md': 'Markdown content encoding.',
+    'html': 'HTML content encoding.',
+}
+_DEFAULT_PO_ENCODING_HELP = (
+    'PO files encoding. If you need different encodings for each'
+    ' file, you must define them in the "Content-Type" field of each'
+    " PO file metadata, in the form 'Content-Type: text/plain;"
+    " charset=<ENCODING>'."
+)
+_GETTEXT_NO_LOCATION = cli_codespan('gettext --no-location')
+_NO_LOCATION_HELP = (
+    "Do not write '#: filename:line' lines. Note that using this"
+    ' option makes it harder for technically skilled translators to'
+    ' understand the context of each message. Same as'
+    f' {_GETTEXT_NO_LOCATION}.'
+)
+
+
+class _LazyHelp:
+    """Help message which defers joining a sequence of values.
+
+    The message is built, only once, when it must be rendered as a
+    string, so CLI invocations which never show the help skip the
+    ``and_join`` call entirely.
+    """
+
+    __slots__ = ('template', 'values', '_rendered')
+
+    def __init__(self, template, values):
+        self.template = template
+        self.values = values
+        self._rendered = None
+
+    def __str__(self):
+        if self._rendered is None:
+            self._rendered = self.template.format(and_join(self.values))
+        return self._rendered
+
+    def __mod__(self, params):
+        # argparse help formatters interpolate help strings with ``%``
+        return str(self) % params
+
+    def strip(self):
+        return str(self).strip()
+
+
+_EXTENSIONS_HELP = _LazyHelp(
+    'md4c extension used to parse markdown content formatted as'
+    ' pymd4c extension keyword arguments. This argument can be passed'
+    ' multiple times. If it is not passed, next extensions are used:'
+    ' {}. You can see all available at'
+    ' https://pymd4c.dcpx.org/api.html#parser-option-flags',
+    DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS,
+)
+if SPHINX_IS_RUNNING:
+    # sphinx-argparse-cli needs plain strings to process help messages
+    _EXTENSIONS_HELP = str(_EXTENSIONS_HELP)
+_COMMAND_ALIAS_HELP = (
+    'Aliases to use custom mdpo command names in comments. This'
+    ' argument can be passed multiple times in the form'
+    ' "<custom-command>:<mdpo-command>". The \'mdpo-\' prefix in'
+    ' command names resolution is optional.'
+    f'{_COMMAND_ALIAS_HELP_EXAMPLE}'
+)
+
+
+class _FastAppend(argparse._AppendAction):
+    """Append action which avoids copying the target list on each call.
+
+    The default ``'append'`` action of argparse copies the accumulated
+    list every time the flag is repeated, making N repetitions O(N^2).
+    Copy only the default value once and append in place afterwards, as
+    done by argparse itself since CPython gh-124909.
+    """
+
+    def __call__(
+        self,
+        parser,  # noqa: ARG002
+        namespace,
+        values,
+        option_string=None,  # noqa: ARG002
+    ):
+        items = getattr(namespace, self.dest, None)
+        if items is self.default:
+            items = list(items) if items else []
+            setattr(namespace, self.dest, items)
+        items.append(values)
+
+
+class _FastArgumentParser(argparse.ArgumentParser):
+    """Argument parser which caches its internal help formatter.
+
+    argparse builds a new :py:class:`argparse.HelpFormatter` on each
+    ``add_argument`` call just to validate the metavar against ``nargs``,
+    which adds up for parsers with many arguments like the mdpo ones.
+    Reuse a single instance instead, discarding it before rendering usage
+    or help messages because formatters accumulate state while rendering.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._cached_formatter = None
+        super().__init__(*args, **kwargs)
+
+    def _get_formatter(self):
+        if self._cached_formatter is None:
+            self._cached_formatter = super()._get_formatter()
+        return self._cached_formatter
+
+    def format_usage(self):
+        self._cached_formatter = None
+        return super().format_usage()
+
+    def format_help(self):
+        self._cached_formatter = None
+        return super().format_help()
+
+
 def parse_escaped_pairs_cli_argument(
     pairs,
-    value_error_message,
-    key_error_message,
+    build_value_error_message,
+    build_key_error_message,
 ):
     """Parse a key argument made by key-value pairs.
 
@@ -44,10 +180,10 @@ def parse_escaped_pairs_cli_argument(
 
     Args:
         pairs (list): List of key-value pairs.
-        value_error_message (str): Error message schema shown when a pair
-            can't be parsed.
-        key_error_message (str): Error message schema shown when a key is
-            repeated.
+        build_value_error_message (callable): Callable which, given a pair
+            that can't be parsed, returns the error message to show.
+        build_key_error_message (callable): Callable which, given a repeated
+            key, returns the error message to show.
 
     Returns:
         dict: Parsed key-value pairs.
@@ -55,10 +191,10 @@ def parse_escaped_pairs_cli_argument(
     try:
         return parse_escaped_pairs(pairs)
     except ValueError as err:
-        sys.stderr.write(value_error_message.format(err.args[0]))
+        sys.stderr.write(build_value_error_message(err.args[0]))
         sys.exit(1)
     except KeyError as err:
-        sys.stderr.write(key_error_message.format(err.args[0]))
+        sys.stderr.write(build_key_error_message(err.args[0]))
         sys.exit(1)
 
 
@@ -76,13 +212,13 @@ def parse_command_aliases_cli_arguments(command_aliases):
     """
     return parse_escaped_pairs_cli_argument(
         command_aliases,
-        (
-            "The value '{}' passed to argument --command-alias"
+        lambda value: (
+            f"The value '{value}' passed to argument --command-alias"
             " can't be parsed. Please, separate the pair "
             "'<custom-command:mdpo-command>' with a ':' character.\n"
         ),
-        (
-            "Multiple resolutions for '{}' alias passed to"
+        lambda key: (
+            f"Multiple resolutions for '{key}' alias passed to"
             ' --command-alias arguments.\n'
         ),
     )
@@ -102,13 +238,13 @@ def parse_metadata_cli_arguments(metadata):
     """
     return parse_escaped_pairs_cli_argument(
         metadata,
-        (
-            "The value '{}' passed to argument --metadata"
+        lambda value: (
+            f"The value '{value}' passed to argument --metadata"
             " can't be parsed. Please, separate the pair "
             "'<key:value>' with a ':' character.\n"
         ),
-        (
-            "Repeated key '{}' passed to --metadata arguments.\n"
+        lambda key: (
+            f"Repeated key '{key}' passed to --metadata arguments.\n"
         ),
     )
 
@@ -116,16 +252,16 @@ def parse_metadata_cli_arguments(metadata):
 def add_common_cli_first_arguments(parser, quiet=True):
     """Add common mdpo arguments to an argument parser at the beginning.
 
+    The parser must be built with ``add_help=True`` (the default), so the
+    built-in ``-h/--help`` action of argparse is reused instead of
+    allocating a redundant one here.
+
     Args:
         parser (:py:class:`argparse.ArgumentParser`): Arguments parser to
             extend.
         quiet (bool): Include the argument ``-q/--quiet``.
     """
-    parser.add_argument(
-        '-h', '--help', action='help',
-        help='Show this help message and exit.',
-        default=argparse.SUPPRESS,
-    )
+    parser._actions[0].help = 'Show this help message and exit.'
     parser.add_argument(
         '-v', '--version', action=ImportlibMetadataVersionAction,
         version_from='mdpo',
@@ -146,27 +282,11 @@ def add_command_alias_argument(parser):
         parser (:py:class:`argparse.ArgumentParser`): Arguments parser to
             extend.
     """
-    mdpo_on_mdpo_enable = cli_codespan(
-        f'--command-alias {OPEN_QUOTE_CHAR}mdpo-on:mdpo-enable'
-        f'{CLOSE_QUOTE_CHAR}',
-    )
-    mdpo_on_enable = cli_codespan(
-        f'--command-alias {OPEN_QUOTE_CHAR}mdpo-on:enable'
-        f'{CLOSE_QUOTE_CHAR}',
-    )
-    command_alias_help_example = (
-        ' For example, if you want to use "<!-- mdpo-on -->" instead of'
-        f' "<!-- mdpo-enable -->", you can pass either {mdpo_on_mdpo_enable}'
-        f' or {mdpo_on_enable} arguments.'
-    )
     parser.add_argument(
-        '--command-alias', dest='command_aliases', default=[], action='append',
+        '--command-alias', dest='command_aliases', default=[],
+        action=_FastAppend,
         metavar='CUSTOM-COMMAND:MDPO-COMMAND',
-        help='Aliases to use custom mdpo command names in comments. This'
-             ' argument can be passed multiple times in the form'
-             ' "<custom-command>:<mdpo-command>". The \'mdpo-\' prefix in'
-             ' command names resolution is optional.'
-             f'{command_alias_help_example}',
+        help=_COMMAND_ALIAS_HELP,
     )
 
 
@@ -178,14 +298,9 @@ def add_extensions_argument(parser):
             extend.
     """
     parser.add_argument(
-        '-x', '--extension', '--ext', dest='extensions', action='append',
+        '-x', '--extension', '--ext', dest='extensions', action=_FastAppend,
         default=None,
-        help='md4c extension used to parse markdown content formatted as'
-             ' pymd4c extension keyword arguments. This argument can be passed'
-             ' multiple times. If it is not passed, next extensions are used:'
-             f' {and_join(DEFAULT_MD4C_GENERIC_PARSER_EXTENSIONS)}.'
-             ' You can see all available at'
-             ' https://pymd4c.dcpx.org/api.html#parser-option-flags',
+        help=_EXTENSIONS_HELP,
         metavar='EXTENSION',
     )
 
@@ -213,10 +328,7 @@ def add_nolocation_option(parser):
     """
     parser.add_argument(
         '--no-location', '--nolocation', dest='location', action='store_false',
-        help="Do not write '#: filename:line' lines. Note that using this"
-             ' option makes it harder for technically skilled translators to'
-             ' understand the context of each message. Same as'
-             f' {cli_codespan("gettext --no-location")}.',
+        help=_NO_LOCATION_HELP,
     )
 
 
@@ -238,20 +350,13 @@ def add_encoding_arguments(
         f'--{markup_encoding}-encoding',
         dest=f'{markup_encoding}_encoding',
         default='utf-8',
-        help=f'{"Markdown" if markup_encoding == "md" else "HTML"}'
-             ' content encoding.',
+        help=_MARKUP_ENCODING_HELP[markup_encoding],
         metavar='ENCODING',
     )
 
-    po_encoding_help = (
-        'PO files encoding. If you need different encodings for each'
-        ' file, you must define them in the "Content-Type" field of each'
-        " PO file metadata, in the form 'Content-Type: text/plain;"
-        " charset=<ENCODING>'."
-    ) if po_encoding_help is None else po_encoding_help
     parser.add_argument(
         '--po-encoding', dest='po_encoding', default=None, metavar='ENCODING',
-        help=po_encoding_help,
+        help=po_encoding_help or _DEFAULT_PO_ENCODING_HELP,
     )
 
 
@@ -324,7 +429,7 @@ def add_event_argument(parser):
             extend.
     """
     parser.add_argument(
-        '-e', '--event', dest='events', default=[], action='append',
+        '-e', '--event', dest='events', default=[], action=_FastAppend,
         metavar='event_name: path/to/file.py::function_name',
         help='Custom events executed during the parser. They are used for'
              ' customize the output. See the documentation for available'
@@ -5,12 +5,13 @@
 See :ref:`md2po CLI<cli:md2po>`.
 """
 
-import argparse
 import sys
 
 from mdpo.cli import (
     CLOSE_QUOTE_CHAR,
     OPEN_QUOTE_CHAR,
+    _FastAppend,
+    _FastArgumentParser,
     add_check_option,
     add_command_alias_argument,
     add_common_cli_first_arguments,
@@ -38,7 +39,7 @@ DESCRIPTION = (
 
 
 def build_parser():
-    parser = argparse.ArgumentParser(description=DESCRIPTION, add_help=False)
+    parser = _FastArgumentParser(description=DESCRIPTION)
     add_common_cli_first_arguments(parser)
     parser.add_argument(
         'files_or_content', metavar='GLOBS_FILES_OR_CONTENT',
@@ -131,7 +132,7 @@ def build_parser():
         f' {cli_codespan(example_codespan)}.'
     )
     parser.add_argument(
-        '-d', '--metadata', dest='metadata', default=[], action='append',
+        '-d', '--metadata', dest='metadata', default=[], action=_FastAppend,
         metavar='Key:Value',
         help='Custom metadata key-value pairs to include in the produced'
              ' PO file. This argument can be passed multiple times.'
@@ -221,7 +222,7 @@ def run(args=frozenset()):
         pofile = md2po.extract(**extract_kwargs)
 
         if not opts.quiet:
-            sys.stdout.write(f'{pofile.__unicode__()}\n')
+            sys.stdout.write(f'{pofile}\n')
 
         # pre-commit mode
         if opts.check_saved_files_changed and md2po._saved_files_changed:
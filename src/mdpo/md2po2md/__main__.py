@@ -5,12 +5,12 @@
 See :ref:`md2po2md CLI<cli:md2po2md>`.
 """
 
-import argparse
 import itertools
 import sys
 
 from mdpo.cli import (
     SPHINX_IS_RUNNING,
+    _FastArgumentParser,
     add_check_option,
     add_command_alias_argument,
     add_common_cli_first_arguments,
@@ -35,7 +35,7 @@ DESCRIPTION = (
 
 
 def build_parser():
-    parser = argparse.ArgumentParser(description=DESCRIPTION, add_help=False)
+    parser = _FastArgumentParser(description=DESCRIPTION)
     add_common_cli_first_arguments(parser, quiet=False)
     parser.add_argument(
         'input_paths_glob', metavar='GLOB', nargs='*',
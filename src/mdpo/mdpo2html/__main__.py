@@ -5,11 +5,11 @@
 See :ref:`mdpo2html CLI<cli:mdpo2html>`.
 """
 
-import argparse
 import itertools
 import sys
 
 from mdpo.cli import (
+    _FastArgumentParser,
     add_check_option,
     add_command_alias_argument,
     add_common_cli_first_arguments,
@@ -25,7 +25,7 @@ DESCRIPTION = 'HTML-produced-from-Markdown file translator using PO files.'
 
 
 def build_parser():
-    parser = argparse.ArgumentParser(description=DESCRIPTION, add_help=False)
+    parser = _FastArgumentParser(description=DESCRIPTION)
     add_common_cli_first_arguments(parser)
     parser.add_argument(
         'filepath_or_content', metavar='FILEPATH_OR_CONTENT',
@@ -10,6 +10,7 @@ import itertools
 import sys
 
 from mdpo.cli import (
+    _FastArgumentParser,
     add_check_option,
     add_command_alias_argument,
     add_common_cli_first_arguments,
@@ -34,9 +35,8 @@ DESCRIPTION = (
 
 
 def build_parser():
-    parser = argparse.ArgumentParser(
+    parser = _FastArgumentParser(
         description=DESCRIPTION,
-        add_help=False,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser._positionals.title = 'positional argument'
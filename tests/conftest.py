@@ -2,6 +2,7 @@
 
 import ast
 import contextlib
+import functools
 import inspect
 import os
 import shutil
@@ -12,6 +13,8 @@ import uuid
 
 import pytest
 
+from mdpo.md2po import markdown_to_pofile
+
 
 rootdir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 temporal_dir = os.path.join(rootdir, 'temp')
@@ -80,6 +83,32 @@ def tmp_dir():
     return _tmp_dir
 
 
+@functools.lru_cache(maxsize=1024)
+def _markdown_to_pofile_cached(content, command_aliases=()):
+    """Cached version of ``markdown_to_pofile`` for tests.
+
+    Identical contents passed by different tests are parsed only once.
+    This is safe because ``markdown_to_pofile`` is pure with respect to
+    its arguments.
+
+    Args:
+        content (str): Markdown content to extract.
+        command_aliases (tuple): Custom command aliases as hashable
+            key-value pairs.
+
+    Returns:
+        str: Rendered PO file content.
+    """
+    return str(
+        markdown_to_pofile(content, command_aliases=dict(command_aliases)),
+    )
+
+
+@pytest.fixture
+def md2po_cached():
+    return _markdown_to_pofile_cached
+
+
 def _git_init(cwd=None):
     return subprocess.run(
         ['git', 'init'],
@@ -3,65 +3,40 @@ import pytest
 from mdpo.md2po import markdown_to_pofile
 
 
-@pytest.mark.parametrize(
-    ('command', 'command_aliases'), (
-        ('mdpo-include', {}),
-        ('this-message-also', {'this-message-also': 'include'}),
-    ),
-)
-def test_include_comment(command, command_aliases):
-    content = f'''<!-- {command} This comment must be included -->
+_CONTENT_INCLUDE = '''<!-- mdpo-include This comment must be included -->
 Some text that needs to be clarified
 
 Some text without comment
 '''
-    pofile = markdown_to_pofile(content, command_aliases=command_aliases)
-    assert pofile == '''#
-msgid ""
-msgstr ""
-
-msgid "This comment must be included"
-msgstr ""
 
-msgid "Some text that needs to be clarified"
-msgstr ""
+_CONTENT_INCLUDE_ALIASED = '''\
+<!-- this-message-also This comment must be included -->
+Some text that needs to be clarified
 
-msgid "Some text without comment"
-msgstr ""
+Some text without comment
 '''
 
+_CONTENT_INCLUDE_WITH_EXTRACTED = '''\
+<!-- mdpo-translator Comment for translator in comment -->
+<!-- mdpo-include This comment must be included -->
+Some text that needs to be clarified
 
-@pytest.mark.parametrize(
-    ('command', 'command_aliases'), (
-        ('mdpo-include', {}),
-        ('this-message-also', {'this-message-also': 'include'}),
-    ),
-)
-def test_include_comment_without_value(command, command_aliases):
-    expected_msg = (
-        'You need to specify a message for the comment to include with the'
-        f" command '{command}'."
-    )
-    with pytest.raises(ValueError, match=expected_msg):
-        markdown_to_pofile(
-            f'<!-- {command} -->',
-            command_aliases=command_aliases,
-        )
-
+Some text without comment
+'''
 
-def test_include_comment_with_extracted():
-    content = '''<!-- mdpo-translator Comment for translator in comment -->
+_CONTENT_INCLUDE_WITH_EXTRACTED_AND_CONTEXT = '''\
+<!-- mdpo-context Some context for the included -->
+<!-- mdpo-translator Comment for translator in comment -->
 <!-- mdpo-include This comment must be included -->
 Some text that needs to be clarified
 
 Some text without comment
 '''
-    pofile = markdown_to_pofile(content)
-    assert pofile == '''#
+
+_EXPECTED_INCLUDE = '''#
 msgid ""
 msgstr ""
 
-#. Comment for translator in comment
 msgid "This comment must be included"
 msgstr ""
 
@@ -72,17 +47,22 @@ msgid "Some text without comment"
 msgstr ""
 '''
 
+_EXPECTED_INCLUDE_WITH_EXTRACTED = '''#
+msgid ""
+msgstr ""
 
-def test_include_comment_with_extracted_and_context():
-    content = '''<!-- mdpo-context Some context for the included -->
-<!-- mdpo-translator Comment for translator in comment -->
-<!-- mdpo-include This comment must be included -->
-Some text that needs to be clarified
+#. Comment for translator in comment
+msgid "This comment must be included"
+msgstr ""
 
-Some text without comment
+msgid "Some text that needs to be clarified"
+msgstr ""
+
+msgid "Some text without comment"
+msgstr ""
 '''
-    pofile = markdown_to_pofile(content)
-    assert pofile == '''#
+
+_EXPECTED_INCLUDE_WITH_EXTRACTED_AND_CONTEXT = '''#
 msgid ""
 msgstr ""
 
@@ -97,3 +77,57 @@ msgstr ""
 msgid "Some text without comment"
 msgstr ""
 '''
+
+
+@pytest.mark.parametrize(
+    ('content', 'command_aliases', 'expected'),
+    (
+        pytest.param(
+            _CONTENT_INCLUDE,
+            {},
+            _EXPECTED_INCLUDE,
+            id='mdpo-include',
+        ),
+        pytest.param(
+            _CONTENT_INCLUDE_ALIASED,
+            {'this-message-also': 'include'},
+            _EXPECTED_INCLUDE,
+            id='command-alias',
+        ),
+        pytest.param(
+            _CONTENT_INCLUDE_WITH_EXTRACTED,
+            {},
+            _EXPECTED_INCLUDE_WITH_EXTRACTED,
+            id='with-extracted',
+        ),
+        pytest.param(
+            _CONTENT_INCLUDE_WITH_EXTRACTED_AND_CONTEXT,
+            {},
+            _EXPECTED_INCLUDE_WITH_EXTRACTED_AND_CONTEXT,
+            id='with-extracted-and-context',
+        ),
+    ),
+)
+def test_include_comment(content, command_aliases, expected, md2po_cached):
+    assert md2po_cached(
+        content,
+        command_aliases=tuple(command_aliases.items()),
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    ('command', 'command_aliases'), (
+        ('mdpo-include', {}),
+        ('this-message-also', {'this-message-also': 'include'}),
+    ),
+)
+def test_include_comment_without_value(command, command_aliases):
+    expected_msg = (
+        'You need to specify a message for the comment to include with the'
+        f" command '{command}'."
+    )
+    with pytest.raises(ValueError, match=expected_msg):
+        markdown_to_pofile(
+            f'<!-- {command} -->',
+            command_aliases=command_aliases,
+        )